@@ -13,18 +13,72 @@ Options:
     --target PATH       Target directory for installation (default: current directory)
     --force            Overwrite existing files
     --no-git           Don't add .gitignore entries
+
+Git sources are cached under $CLAUDE_INIT_CACHE (default: ~/.cache/claude_init)
+and refreshed with a shallow fetch on later runs.
 """
 
 import os
 import sys
+import mmap
+import stat
+import time
 import shutil
+import fnmatch
 import argparse
-import tempfile
-import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
-import json
+from typing import Optional, Dict, List, Set
+
+# Batches smaller than this run inline instead of on a thread pool
+PARALLEL_MIN_ITEMS = 16
+
+# Cached source clones unused for this long are pruned after a sync
+CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+# Cache entries are named by the first 16 hex digits of the URL's sha1
+CACHE_KEY_PATTERN = "[0-9a-f]" * 16
+
+# Records the package.json (and lockfile) hash node_modules was last
+# installed from
+NPM_INSTALL_STAMP = ".npm_install_stamp"
+
+# Installed or generated artifacts never copied from a source dashboard;
+# its package-lock.json is kept so npm ci can install from it
+DASHBOARD_IGNORE_PATTERNS = ("node_modules", ".git", "*.log")
+
+# Header line of the block added to .gitignore; its presence means the
+# entries were already added
+GITIGNORE_MARKER = b"# Claude task management"
+
+# Block appended to .gitignore; the leading newline separates it from any
+# existing content, so no trailing-newline check is needed
+GITIGNORE_ADDITIONS = (
+    b"\n" + GITIGNORE_MARKER + b"\n"
+    b"*.backup\n"
+    b"CLAUDE.md.backup\n"
+    b"\n# Test Dashboard Module\n"
+    b"test-dashboard-module/node_modules/\n"
+    b"test-dashboard-module/package-lock.json\n"
+    b"test-dashboard-module/test-registry.json\n"
+    b"test-dashboard-module/" + NPM_INSTALL_STAMP.encode("utf-8") + b"\n"
+)
+
+# package.json for the embedded dashboard; %s is the JSON-escaped project name
+PACKAGE_JSON_TEMPLATE = b"""{
+  "name": "%s-test-dashboard",
+  "version": "1.0.0",
+  "description": "Test dashboard for project test management",
+  "main": "server.js",
+  "scripts": {
+    "start": "node server.js",
+    "discover": "node scripts/discover-tests.js"
+  },
+  "dependencies": {
+    "express": "^4.18.2",
+    "cors": "^2.8.5"
+  }
+}
+"""
 
 # Embedded templates for when no source is provided
 EMBEDDED_TEMPLATES = {
@@ -108,39 +162,151 @@ RED → GREEN → REFACTOR
 """
 }
 
+# Templates encoded once at import as (content, needs_date) so templates
+# without the [DATE] placeholder are never scanned at runtime
+_DATE_PLACEHOLDER = b"[DATE]"
+_COMPILED_TEMPLATES = {
+    name: (content.encode("utf-8"), "[DATE]" in content)
+    for name, content in EMBEDDED_TEMPLATES.items()
+}
+
+# Reference section prepended to an existing CLAUDE.md
+CLAUDE_MD_REFERENCE = """# CLAUDE.md
+
+## 📋 Claude Development Process
+This project now uses the Claude Task Management System for AI-assisted development.
+
+### Key Documents
+- `claude_tasks/QUICK_REFERENCE.md` - Quick commands and workflow
+- `claude_tasks/DEVELOPMENT_PROCESS.md` - Full TDD methodology
+- `claude_tasks/PRINCIPLES_QUICK_CARD.md` - Core development principles
+- `claude_tasks/active/ACTIVE_TASKS.md` - Current task tracking
+
+---
+
+""".encode("utf-8")
+
+# CLAUDE.md written when neither target nor source provides one
+CLAUDE_MD_TEMPLATE = """# CLAUDE.md
+
+This file provides guidance to Claude Code (claude.ai/code) when working with code in this repository.
+
+## Claude Development Process
+
+This project follows the Claude Task Management System. See `claude_tasks/` for:
+- `QUICK_REFERENCE.md` - Quick commands and TDD workflow
+- `DEVELOPMENT_PROCESS.md` - Complete methodology
+- `PRINCIPLES_QUICK_CARD.md` - Core principles
+- `active/ACTIVE_TASKS.md` - Current tasks
+
+## Repository Overview
+
+[TODO: Add project description]
+
+## Project Structure
+
+```
+[TODO: Document structure]
+```
+
+## Common Development Commands
+
+### Testing
+```bash
+# Run tests
+npm test  # or appropriate command
+
+# With coverage
+npm test -- --coverage
+
+# Watch mode
+npm test -- --watch
+```
+
+## Working with this Codebase
+
+Follow TDD: RED → GREEN → REFACTOR
+
+See `claude_tasks/` for detailed methodology.
+""".encode("utf-8")
+
+
 class ClaudeTasksSetup:
     """Setup Claude task management system in a project."""
     
     def __init__(self, source: Optional[str] = None, target: str = ".", 
                  force: bool = False, no_git: bool = False):
         self.source = source
-        self.target = Path(target).resolve()
+        self._is_remote = bool(source) and source.startswith(("http://", "https://", "git@"))
+        # abspath is purely lexical; resolve() would stat/readlink every
+        # ancestor, and symlink canonicalization is not needed here
+        self.target = Path(os.path.abspath(target))
         self.force = force
         self.no_git = no_git
         self.claude_tasks_dir = self.target / "claude_tasks"
         self.claude_md_path = self.target / "CLAUDE.md"
+        # String forms of hot child paths; os/shutil calls accept them as-is
+        self._target_str = os.fspath(self.target)
+        self._claude_tasks_dir_str = os.path.join(self._target_str, "claude_tasks")
+        self._active_dir_str = os.path.join(self._claude_tasks_dir_str, "active")
+        self._finished_dir_str = os.path.join(self._claude_tasks_dir_str, "finished")
+        self._resolved_source: Optional[Path] = None
+        self._existing: Set[str] = set()
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        self._git_executable: Optional[str] = None
+        self._log: List[str] = []
         
     def run(self):
         """Execute the setup process."""
-        print("🚀 Claude Task Management System Setup")
-        print(f"📁 Target directory: {self.target}")
+        try:
+            self._run_steps()
+        finally:
+            # Progress lines are buffered; emit them even if a step failed
+            self._flush_log()
+            # The resolved source and stat results are only valid for this
+            # run; a reused instance must re-sync and re-stat
+            self._resolved_source = None
+            self._stat_cache.clear()
+    
+    def _log_print(self, message: str):
+        """Queue a progress line for the next batched write to stdout."""
+        self._log.append(message + "\n")
+    
+    def _flush_log(self):
+        """Write all queued progress lines with a single stdout write."""
+        if self._log:
+            sys.stdout.write("".join(self._log))
+            sys.stdout.flush()
+            self._log.clear()
+    
+    def _run_steps(self):
+        """Run each installation step, queueing progress output."""
+        self._log_print("🚀 Claude Task Management System Setup")
+        self._log_print(f"📁 Target directory: {self.target}")
         
         # Check what already exists
-        claude_tasks_exists = self.claude_tasks_dir.exists()
-        test_dashboard_exists = (self.target / "test-dashboard-module").exists()
-        claude_md_exists = self.claude_md_path.exists()
-        
-        print(f"\n📋 Current state:")
-        print(f"   claude_tasks/: {'✅ exists' if claude_tasks_exists else '❌ missing'}")
-        print(f"   test-dashboard-module/: {'✅ exists' if test_dashboard_exists else '❌ missing'}")
-        print(f"   CLAUDE.md: {'✅ exists' if claude_md_exists else '❌ missing'}")
+        self._existing = self._scan_target()
+        claude_tasks_exists = "claude_tasks" in self._existing
+        test_dashboard_exists = "test-dashboard-module" in self._existing
+        claude_md_exists = "CLAUDE.md" in self._existing
+        
+        self._log_print(f"\n📋 Current state:")
+        self._log_print(f"   claude_tasks/: {'✅ exists' if claude_tasks_exists else '❌ missing'}")
+        self._log_print(f"   test-dashboard-module/: {'✅ exists' if test_dashboard_exists else '❌ missing'}")
+        self._log_print(f"   CLAUDE.md: {'✅ exists' if claude_md_exists else '❌ missing'}")
+        
+        # Fetch the source once, before touching the target, so a bad source
+        # fails fast; every installer below reuses the resolved path
+        nothing_to_install = claude_tasks_exists and test_dashboard_exists and claude_md_exists
+        if self.source and (self.force or not nothing_to_install):
+            self._resolve_source()
         
         # Install claude_tasks if missing or force flag is set
         if not claude_tasks_exists or self.force:
             if claude_tasks_exists and self.force:
-                print(f"\n🔄 Reinstalling claude_tasks (--force flag)")
+                self._log_print(f"\n🔄 Reinstalling claude_tasks (--force flag)")
             else:
-                print(f"\n📦 Installing claude_tasks...")
+                self._log_print(f"\n📦 Installing claude_tasks...")
             
             # Create claude_tasks directory
             self._create_directory_structure()
@@ -150,91 +316,192 @@ class ClaudeTasksSetup:
                 self._copy_from_source()
             else:
                 self._create_from_templates()
+            self._existing.add("claude_tasks")
         else:
-            print(f"\n⏭️  Skipping claude_tasks (already exists)")
+            self._log_print(f"\n⏭️  Skipping claude_tasks (already exists)")
         
         # Handle CLAUDE.md if missing or force flag is set
         if not claude_md_exists or self.force:
             if claude_md_exists and self.force:
-                print(f"\n🔄 Updating CLAUDE.md (--force flag)")
+                self._log_print(f"\n🔄 Updating CLAUDE.md (--force flag)")
             else:
-                print(f"\n📝 Creating CLAUDE.md...")
+                self._log_print(f"\n📝 Creating CLAUDE.md...")
             self._handle_claude_md()
+            self._existing.add("CLAUDE.md")
         else:
-            print(f"\n⏭️  Skipping CLAUDE.md (already exists)")
+            self._log_print(f"\n⏭️  Skipping CLAUDE.md (already exists)")
         
         # Install test dashboard if missing or force flag is set
         if not test_dashboard_exists or self.force:
             if test_dashboard_exists and self.force:
-                print(f"\n🔄 Reinstalling test-dashboard-module (--force flag)")
+                self._log_print(f"\n🔄 Reinstalling test-dashboard-module (--force flag)")
             else:
-                print(f"\n📊 Installing test-dashboard-module...")
-            self._install_test_dashboard()
+                self._log_print(f"\n📊 Installing test-dashboard-module...")
+            if self._install_test_dashboard():
+                self._existing.add("test-dashboard-module")
         else:
-            print(f"\n⏭️  Skipping test-dashboard-module (already exists)")
+            self._log_print(f"\n⏭️  Skipping test-dashboard-module (already exists)")
         
         # Add .gitignore entries
         if not self.no_git:
             self._update_gitignore()
         
-        print("\n✅ Setup complete!")
+        self._log_print("\n✅ Setup complete!")
         self._print_next_steps()
     
+    def _scan_target(self) -> Set[str]:
+        """List the target's top-level entry names in a single directory read."""
+        try:
+            with os.scandir(self.target) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+    
+    def _cached_stat(self, path) -> Optional[os.stat_result]:
+        """Stat a path at most once per run, returning None if it is missing."""
+        key = os.fspath(path)
+        if key not in self._stat_cache:
+            try:
+                self._stat_cache[key] = os.stat(key)
+            except (FileNotFoundError, NotADirectoryError):
+                self._stat_cache[key] = None
+        return self._stat_cache[key]
+    
+    def _forget_stat(self, path):
+        """Drop a cached stat after the path has been written."""
+        self._stat_cache.pop(os.fspath(path), None)
+    
     def _create_directory_structure(self):
         """Create the claude_tasks directory structure."""
-        directories = [
-            self.claude_tasks_dir,
-            self.claude_tasks_dir / "active",
-            self.claude_tasks_dir / "finished",
-        ]
-        
-        for directory in directories:
-            if not directory.exists():
-                directory.mkdir(parents=True, exist_ok=True)
-                print(f"📁 Created: {directory.relative_to(self.target)}")
+        # Only the leaves are needed; makedirs creates claude_tasks itself
+        created_root = "claude_tasks" not in self._existing
+        for leaf in (self._active_dir_str, self._finished_dir_str):
+            try:
+                os.makedirs(leaf)
+            except FileExistsError:
+                continue
+            if created_root:
+                self._log_print(f"📁 Created: claude_tasks")
+                created_root = False
+            self._log_print(f"📁 Created: {os.path.relpath(leaf, self._target_str)}")
     
-    def _copy_from_source(self):
-        """Copy files from source repository or directory."""
-        temp_dir = None
-        
-        try:
+    def _resolve_source(self) -> Path:
+        """Return the local path of the source, cloning it at most once per run."""
+        if self._resolved_source is None:
             # Determine source type and get path
-            if self.source.startswith(("http://", "https://", "git@")):
-                # Clone from git
-                temp_dir = tempfile.mkdtemp()
-                print(f"📥 Cloning from: {self.source}")
-                subprocess.run(
-                    ["git", "clone", "--depth", "1", self.source, temp_dir],
-                    check=True,
-                    capture_output=True
-                )
-                # Remove .git folder to avoid confusion
-                git_dir = Path(temp_dir) / ".git"
-                if git_dir.exists():
-                    shutil.rmtree(git_dir)
-                source_path = Path(temp_dir) / "claude_tasks"
+            if self._is_remote:
+                self._resolved_source = self._sync_cached_clone()
             else:
                 # Local path
                 source_path = Path(self.source)
                 if not source_path.exists():
                     raise FileNotFoundError(f"Source not found: {source_path}")
-                
-                # Check if source has claude_tasks subdirectory
-                if (source_path / "claude_tasks").exists():
-                    source_path = source_path / "claude_tasks"
-            
-            # Copy files
-            self._copy_files(source_path)
-            
-        finally:
-            # Clean up temp directory
-            if temp_dir and Path(temp_dir).exists():
-                shutil.rmtree(temp_dir)
+                self._resolved_source = source_path
+        
+        return self._resolved_source
+    
+    def _copy_from_source(self):
+        """Copy files from source repository or directory."""
+        source_path = self._resolve_source()
+        
+        if self._is_remote:
+            # A clone without claude_tasks falls back to embedded templates
+            source_path = source_path / "claude_tasks"
+        elif (source_path / "claude_tasks").exists():
+            # Check if source has claude_tasks subdirectory
+            source_path = source_path / "claude_tasks"
+        
+        # Copy files
+        self._copy_files(source_path)
+    
+    def _sync_cached_clone(self) -> Path:
+        """Clone or refresh the git source in the user cache, return its path."""
+        import hashlib  # only remote sources need a cache key
+        # Resolved here so runs that never clone never look up the home dir
+        cache_root = Path(os.environ.get("CLAUDE_INIT_CACHE")
+                          or Path.home() / ".cache" / "claude_init")
+        cache_dir = cache_root / hashlib.sha1(self.source.encode()).hexdigest()[:16]
+        
+        if (cache_dir / ".git").exists():
+            self._log_print(f"🔄 Updating cached clone of: {self.source}")
+            self._flush_log()  # show progress before blocking on the network
+            self._run_git("-C", str(cache_dir), "fetch", "--quiet", "--depth=1", "--no-tags",
+                          "--filter=blob:none", "origin", "HEAD")
+            self._run_git("-C", str(cache_dir), "reset", "--quiet", "--hard", "FETCH_HEAD")
+        else:
+            self._log_print(f"📥 Cloning from: {self.source}")
+            self._flush_log()  # show progress before blocking on the network
+            import tempfile  # only needed for the first clone of a source
+            cache_root.mkdir(parents=True, exist_ok=True)
+            # Clone next to the cache entry and rename it into place, so an
+            # interrupted clone never leaves a half-populated entry behind
+            with tempfile.TemporaryDirectory(prefix="claude_init_", dir=cache_root) as temp_dir:
+                clone_dir = os.path.join(temp_dir, "repo")
+                # Shallow, blobless clone: only the tip tree is transferred
+                self._run_git("-c", "protocol.version=2", "clone", "--quiet", "--depth=1",
+                              "--single-branch", "--no-tags", "--filter=blob:none",
+                              "--no-checkout", self.source, clone_dir)
+                # Only materialize the subtrees we read (cone mode always
+                # includes top-level files such as CLAUDE.md)
+                self._run_git("-C", clone_dir, "sparse-checkout", "set",
+                              "claude_tasks", "test-dashboard-module")
+                self._run_git("-C", clone_dir, "checkout", "--quiet")
+                try:
+                    os.rename(clone_dir, cache_dir)
+                except OSError:
+                    # A concurrent run cloned the same source first; its
+                    # entry is just as good as ours
+                    if not (cache_dir / ".git").exists():
+                        raise
+        
+        # Mark as recently used so pruning keeps it
+        os.utime(cache_dir)
+        self._prune_cache(cache_root)
+        return cache_dir
+    
+    def _run_git(self, *args: str):
+        """Run git, discarding stdout and keeping stderr only for error reports."""
+        # An absolute executable with close_fds=False (and no cwd) lets
+        # subprocess use posix_spawn instead of fork+exec; our own fds are
+        # non-inheritable by default, so nothing extra leaks into git
+        if self._git_executable is None:
+            self._git_executable = shutil.which("git") or "git"
+        
+        import subprocess  # only remote sources run git
+        try:
+            subprocess.run(
+                [self._git_executable, *args],
+                check=True,
+                close_fds=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace").strip()
+            raise RuntimeError(f"git command failed: {stderr}") from e
+    
+    @staticmethod
+    def _prune_cache(cache_root: Path):
+        """Remove cached source clones that have not been used recently."""
+        # The cache root may be shared, so only touch entries we created:
+        # clone keys and leftover temporary clone directories
+        cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+        for entry in cache_root.iterdir():
+            if not (fnmatch.fnmatchcase(entry.name, CACHE_KEY_PATTERN)
+                    or entry.name.startswith("claude_init_")):
+                continue
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
     
     def _copy_files(self, source_path: Path):
         """Copy files from source to target."""
-        if not source_path.exists():
-            print(f"⚠️  Source claude_tasks not found, using embedded templates")
+        # One directory read both proves the source exists and tells which
+        # of the wanted files it has, instead of a stat per file
+        source_dir = os.fspath(source_path)
+        try:
+            present = set(os.listdir(source_dir))
+        except FileNotFoundError:
+            self._log_print(f"⚠️  Source claude_tasks not found, using embedded templates")
             self._create_from_templates()
             return
         
@@ -249,176 +516,191 @@ class ClaudeTasksSetup:
             "TASK_TEMPLATE.md",
         ]
         
+        # (source, target, label) for each file that needs copying
+        copies = []
         for file_name in files_to_copy:
-            source_file = source_path / file_name
-            target_file = self.claude_tasks_dir / file_name
+            if file_name not in present:
+                continue
+            source_file = os.path.join(source_dir, file_name)
+            target_file = os.path.join(self._claude_tasks_dir_str, file_name)
             
-            if source_file.exists():
-                if target_file.exists() and not self.force:
-                    print(f"⏭️  Skipping existing: {file_name}")
-                else:
-                    shutil.copy2(source_file, target_file)
-                    print(f"📄 Copied: {file_name}")
+            if self._cached_stat(target_file) is not None and not self.force:
+                self._log_print(f"⏭️  Skipping existing: {file_name}")
+            else:
+                copies.append((source_file, target_file, file_name))
         
         # Copy active tasks if exists
-        active_tasks = source_path / "active" / "ACTIVE_TASKS.md"
-        if active_tasks.exists():
-            target_active = self.claude_tasks_dir / "active" / "ACTIVE_TASKS.md"
-            if not target_active.exists() or self.force:
-                shutil.copy2(active_tasks, target_active)
-                print(f"📄 Copied: active/ACTIVE_TASKS.md")
+        active_tasks = os.path.join(source_dir, "active", "ACTIVE_TASKS.md")
+        if self._cached_stat(active_tasks) is not None:
+            target_active = os.path.join(self._active_dir_str, "ACTIVE_TASKS.md")
+            if self._cached_stat(target_active) is None or self.force:
+                copies.append((active_tasks, target_active, "active/ACTIVE_TASKS.md"))
+        
+        # Copies are independent and I/O-bound, so overlap them; each
+        # source is stat'd once, and the result reused for its metadata
+        self._run_parallel(
+            lambda copy: self._fast_copy(copy[0], copy[1], self._cached_stat(copy[0])),
+            copies
+        )
+        for _, target_file, label in copies:
+            self._forget_stat(target_file)
+            self._log_print(f"📄 Copied: {label}")
+    
+    @staticmethod
+    def _fast_copy(src, dst, st: Optional[os.stat_result] = None):
+        """Copy a file in-kernel where supported, keeping its mode and timestamps."""
+        # Callers that already stat'd the source pass it in to skip a syscall
+        if st is None:
+            st = os.stat(src)
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = st.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report 0 before EOF, and the
+                        # source may have changed since it was stat'd
+                        break
+                    remaining -= copied
+        except (AttributeError, OSError):
+            # No copy_file_range (non-Linux, Python < 3.8) or unsupported
+            # across these filesystems (EXDEV)
+            remaining = -1
+        if remaining != 0:
+            # copyfile still uses sendfile on Linux and fcopyfile on macOS
+            shutil.copyfile(src, dst)
+        
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return dst
     
     def _create_from_templates(self):
         """Create files from embedded templates."""
-        print("📝 Creating from embedded templates...")
+        self._log_print("📝 Creating from embedded templates...")
         
-        for file_name, content in EMBEDDED_TEMPLATES.items():
+        # (target, content, file name) for each template that needs writing
+        writes = []
+        today = datetime.now().strftime("%Y-%m-%d").encode("utf-8")
+        for file_name, (content, needs_date) in _COMPILED_TEMPLATES.items():
             if file_name == "ACTIVE_TASKS.md":
-                target_file = self.claude_tasks_dir / "active" / file_name
+                target_file = os.path.join(self._active_dir_str, file_name)
             else:
-                target_file = self.claude_tasks_dir / file_name
+                target_file = os.path.join(self._claude_tasks_dir_str, file_name)
             
-            if target_file.exists() and not self.force:
-                print(f"⏭️  Skipping existing: {file_name}")
+            if self._cached_stat(target_file) is not None and not self.force:
+                self._log_print(f"⏭️  Skipping existing: {file_name}")
             else:
                 # Update date in content
-                content = content.replace("[DATE]", datetime.now().strftime("%Y-%m-%d"))
-                target_file.write_text(content)
-                print(f"📄 Created: {file_name}")
+                if needs_date:
+                    content = content.replace(_DATE_PLACEHOLDER, today)
+                writes.append((target_file, content, file_name))
+        
+        self._run_parallel(lambda write: self._write_file(write[0], write[1]), writes)
+        for target_file, _, file_name in writes:
+            self._forget_stat(target_file)
+            self._log_print(f"📄 Created: {file_name}")
+    
+    @staticmethod
+    def _write_file(path, data: bytes):
+        """Write bytes to a file, replacing any existing content."""
+        # Raw descriptor: no buffered/text wrapper around a single write
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o666)  # umask applies, as with write_text
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _run_parallel(func, items: List):
+        """Apply func to every item on a small thread pool, re-raising errors."""
+        # A handful of small local writes finish before a pool would start
+        if len(items) < PARALLEL_MIN_ITEMS:
+            for item in items:
+                func(item)
+            return
+        # concurrent.futures pulls in logging; only load it when used
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            list(executor.map(func, items))
     
     def _handle_claude_md(self):
         """Create or update CLAUDE.md file."""
-        if self.claude_md_path.exists():
-            self._update_existing_claude_md()
-        else:
+        # Opening the file doubles as the existence check
+        try:
+            existing_content = self.claude_md_path.read_bytes()
+        except FileNotFoundError:
             self._create_new_claude_md()
+        else:
+            self._update_existing_claude_md(existing_content)
     
-    def _update_existing_claude_md(self):
+    def _update_existing_claude_md(self, existing_content: bytes):
         """Prepend task system reference to existing CLAUDE.md."""
-        print(f"📝 Updating existing CLAUDE.md...")
-        
-        existing_content = self.claude_md_path.read_text()
+        self._log_print(f"📝 Updating existing CLAUDE.md...")
         
         # Check if already has task system reference
-        if "claude_tasks" in existing_content:
-            print("✓ CLAUDE.md already references task system")
+        if b"claude_tasks" in existing_content:
+            self._log_print("✓ CLAUDE.md already references task system")
             return
         
-        # Prepend reference section
-        reference_section = """# CLAUDE.md
-
-## 📋 Claude Development Process
-This project now uses the Claude Task Management System for AI-assisted development.
-
-### Key Documents
-- `claude_tasks/QUICK_REFERENCE.md` - Quick commands and workflow
-- `claude_tasks/DEVELOPMENT_PROCESS.md` - Full TDD methodology
-- `claude_tasks/PRINCIPLES_QUICK_CARD.md` - Core development principles
-- `claude_tasks/active/ACTIVE_TASKS.md` - Current task tracking
-
----
-
-""" 
-        
         # Remove existing header if present
-        if existing_content.startswith("# CLAUDE.md"):
-            existing_content = existing_content[existing_content.find("\n")+1:]
+        if existing_content.startswith(b"# CLAUDE.md"):
+            _, _, existing_content = existing_content.partition(b"\n")
         
-        new_content = reference_section + existing_content
+        # Prepend reference section
+        new_content = CLAUDE_MD_REFERENCE + existing_content
         
         if not self.force:
             # Backup existing file
             backup_path = self.claude_md_path.with_suffix(".md.backup")
             shutil.copy2(self.claude_md_path, backup_path)
-            print(f"📋 Backed up to: {backup_path.name}")
+            self._log_print(f"📋 Backed up to: {backup_path.name}")
         
-        self.claude_md_path.write_text(new_content)
-        print("✅ Updated CLAUDE.md with task system reference")
+        self._write_file(self.claude_md_path, new_content)
+        self._log_print("✅ Updated CLAUDE.md with task system reference")
     
     def _create_new_claude_md(self):
         """Create new CLAUDE.md from template."""
-        print("📝 Creating new CLAUDE.md...")
+        self._log_print("📝 Creating new CLAUDE.md...")
         
-        # Get template from source if available
-        template_path = None
+        # Get template from source if available; copy2 reports a missing one
+        copied = False
         if self.source:
-            if self.source.startswith(("http://", "https://", "git@")):
-                # Would need to clone again, skip for now
+            try:
+                shutil.copy2(self._resolve_source() / "CLAUDE.md", self.claude_md_path)
+                copied = True
+            except FileNotFoundError:
                 pass
-            else:
-                source_path = Path(self.source)
-                if (source_path / "CLAUDE.md").exists():
-                    template_path = source_path / "CLAUDE.md"
         
-        if template_path and template_path.exists():
-            shutil.copy2(template_path, self.claude_md_path)
-        else:
+        if not copied:
             # Use embedded template
             content = self._get_claude_md_template()
-            self.claude_md_path.write_text(content)
+            self._write_file(self.claude_md_path, content)
         
-        print("✅ Created CLAUDE.md")
+        self._log_print("✅ Created CLAUDE.md")
     
-    def _get_claude_md_template(self) -> str:
+    def _get_claude_md_template(self) -> bytes:
         """Get the CLAUDE.md template."""
-        return """# CLAUDE.md
-
-This file provides guidance to Claude Code (claude.ai/code) when working with code in this repository.
-
-## Claude Development Process
-
-This project follows the Claude Task Management System. See `claude_tasks/` for:
-- `QUICK_REFERENCE.md` - Quick commands and TDD workflow
-- `DEVELOPMENT_PROCESS.md` - Complete methodology
-- `PRINCIPLES_QUICK_CARD.md` - Core principles
-- `active/ACTIVE_TASKS.md` - Current tasks
-
-## Repository Overview
-
-[TODO: Add project description]
-
-## Project Structure
-
-```
-[TODO: Document structure]
-```
-
-## Common Development Commands
-
-### Testing
-```bash
-# Run tests
-npm test  # or appropriate command
-
-# With coverage
-npm test -- --coverage
-
-# Watch mode
-npm test -- --watch
-```
-
-## Working with this Codebase
-
-Follow TDD: RED → GREEN → REFACTOR
-
-See `claude_tasks/` for detailed methodology.
-"""
+        return CLAUDE_MD_TEMPLATE
     
-    def _install_test_dashboard(self):
-        """Install test dashboard module."""
+    def _install_test_dashboard(self) -> bool:
+        """Install test dashboard module, returning whether it was installed."""
+        # Without Node.js the dashboard is unusable; --force installs anyway
+        # so dependencies can be installed manually later
+        if shutil.which("npm") is None and not self.force:
+            self._log_print("⚠️  npm not found; skipping test-dashboard-module")
+            return False
+        
         test_dashboard_dir = self.target / "test-dashboard-module"
         
         # Determine source for test dashboard
         source_dashboard = None
         if self.source:
-            if self.source.startswith(("http://", "https://", "git@")):
-                # For git sources, we'd need to clone again - for now, use embedded files
-                pass
-            else:
-                source_path = Path(self.source)
-                potential_dashboard = source_path / "test-dashboard-module"
-                if potential_dashboard.exists():
-                    source_dashboard = potential_dashboard
+            potential_dashboard = self._resolve_source() / "test-dashboard-module"
+            if potential_dashboard.exists():
+                source_dashboard = potential_dashboard
         
         if source_dashboard:
             # Copy existing dashboard
@@ -427,50 +709,59 @@ See `claude_tasks/` for detailed methodology.
             # Create minimal dashboard from embedded template
             self._create_embedded_dashboard(test_dashboard_dir)
         
-        # Install Node.js dependencies
-        self._install_node_dependencies(test_dashboard_dir)
+        # Install Node.js dependencies; only a copied dashboard ships a lockfile
+        self._install_node_dependencies(test_dashboard_dir,
+                                        use_lockfile=source_dashboard is not None)
+        return True
     
     def _copy_test_dashboard(self, source_dir: Path, target_dir: Path):
         """Copy test dashboard from source."""
+        # Clear previous install, keeping node_modules for the npm cache check
         if target_dir.exists():
-            shutil.rmtree(target_dir)
-        
-        # Copy entire directory
-        shutil.copytree(source_dir, target_dir)
-        
-        # Remove node_modules and package-lock.json if they exist
-        for item in ["node_modules", "package-lock.json"]:
-            item_path = target_dir / item
-            if item_path.exists():
-                if item_path.is_dir():
-                    shutil.rmtree(item_path)
+            for item in target_dir.iterdir():
+                if item.name in ("node_modules", NPM_INSTALL_STAMP):
+                    continue
+                if item.is_dir() and not item.is_symlink():
+                    shutil.rmtree(item)
                 else:
-                    item_path.unlink()
+                    item.unlink()
+        
+        # Walk the source once, skipping installed/generated artifacts up
+        # front; symlinked directories are followed, as copytree did
+        target_dir_str = os.fspath(target_dir)
+        directories = []
+        copies = []
+        for root, dirs, files in os.walk(source_dir, followlinks=True):
+            dirs[:] = [d for d in dirs if not self._is_dashboard_ignored(d)]
+            target_root = os.path.normpath(
+                os.path.join(target_dir_str, os.path.relpath(root, source_dir)))
+            directories.append(target_root)
+            copies.extend(
+                (os.path.join(root, name), os.path.join(target_root, name))
+                for name in files
+                if not self._is_dashboard_ignored(name)
+            )
         
-        print(f"📊 Copied test dashboard to: {target_dir.relative_to(self.target)}")
+        # Create the whole tree parents-first, then copy files into it
+        for directory in sorted(directories, key=lambda d: d.count(os.sep)):
+            os.makedirs(directory, exist_ok=True)
+        self._run_parallel(lambda copy: self._fast_copy(copy[0], copy[1]), copies)
+        
+        self._log_print(f"📊 Copied test dashboard to: {target_dir.relative_to(self.target)}")
+    
+    @staticmethod
+    def _is_dashboard_ignored(name: str) -> bool:
+        """Check whether a dashboard entry matches DASHBOARD_IGNORE_PATTERNS."""
+        return any(fnmatch.fnmatch(name, pattern) for pattern in DASHBOARD_IGNORE_PATTERNS)
     
     def _create_embedded_dashboard(self, target_dir: Path):
         """Create basic test dashboard from embedded template."""
         target_dir.mkdir(exist_ok=True)
         
         # Create package.json
-        package_json = {
-            "name": f"{self.target.name}-test-dashboard",
-            "version": "1.0.0",
-            "description": "Test dashboard for project test management",
-            "main": "server.js",
-            "scripts": {
-                "start": "node server.js",
-                "discover": "node scripts/discover-tests.js"
-            },
-            "dependencies": {
-                "express": "^4.18.2",
-                "cors": "^2.8.5"
-            }
-        }
-        
-        with open(target_dir / "package.json", "w") as f:
-            json.dump(package_json, f, indent=2)
+        project_name = self.target.name.replace("\\", "\\\\").replace('"', '\\"')
+        (target_dir / "package.json").write_bytes(
+            PACKAGE_JSON_TEMPLATE % project_name.encode("utf-8"))
         
         # Create basic server.js (minimal version)
         server_js = '''#!/usr/bin/env node
@@ -519,20 +810,41 @@ console.log("To get full test discovery, copy from claude_init repository");
         
         (scripts_dir / "discover-tests.js").write_text(discover_script)
         
-        print(f"📊 Created basic test dashboard at: {target_dir.relative_to(self.target)}")
-        print("   For full functionality, copy complete dashboard from claude_init")
+        self._log_print(f"📊 Created basic test dashboard at: {target_dir.relative_to(self.target)}")
+        self._log_print("   For full functionality, copy complete dashboard from claude_init")
     
-    def _install_node_dependencies(self, dashboard_dir: Path):
+    def _install_node_dependencies(self, dashboard_dir: Path, use_lockfile: bool = False):
         """Install Node.js dependencies for the test dashboard."""
         package_json = dashboard_dir / "package.json"
         if not package_json.exists():
-            print("⚠️  No package.json found, skipping npm install")
+            self._log_print("⚠️  No package.json found, skipping npm install")
             return
         
+        # npm ci is deterministic and installs exactly the lockfile; both
+        # commands reuse ~/.npm
+        lockfile = dashboard_dir / "package-lock.json"
+        use_lockfile = use_lockfile and lockfile.exists()
+        npm_command = "ci" if use_lockfile else "install"
+        
+        # Skip when node_modules was installed from these exact manifests
+        import hashlib  # only needed once a dashboard is being installed
+        stamp_path = dashboard_dir / NPM_INSTALL_STAMP
+        digest = hashlib.sha256(package_json.read_bytes())
+        if use_lockfile:
+            digest.update(lockfile.read_bytes())
+        package_hash = digest.hexdigest()
+        if (dashboard_dir / "node_modules").is_dir() and stamp_path.exists():
+            if stamp_path.read_text().strip() == package_hash:
+                self._log_print("✅ Node.js dependencies already installed (cached)")
+                return
+        
+        import subprocess  # skipped when node_modules is already current
         try:
-            print("📦 Installing Node.js dependencies...")
+            self._log_print("📦 Installing Node.js dependencies...")
+            self._flush_log()  # npm can take minutes; show progress first
             result = subprocess.run(
-                ["npm", "install"],
+                ["npm", npm_command, "--prefer-offline", "--no-audit", "--no-fund",
+                 "--ignore-scripts"],
                 cwd=dashboard_dir,
                 capture_output=True,
                 text=True,
@@ -540,95 +852,80 @@ console.log("To get full test discovery, copy from claude_init repository");
             )
             
             if result.returncode == 0:
-                print("✅ Node.js dependencies installed successfully")
+                stamp_path.write_text(package_hash + "\n")
+                self._log_print("✅ Node.js dependencies installed successfully")
             else:
-                print(f"⚠️  npm install completed with warnings")
+                self._log_print(f"⚠️  npm install completed with warnings")
                 if result.stderr:
-                    print(f"   stderr: {result.stderr[:200]}...")
+                    self._log_print(f"   stderr: {result.stderr[:200]}...")
                     
         except subprocess.TimeoutExpired:
-            print("⚠️  npm install timed out, but dashboard was created")
+            self._log_print("⚠️  npm install timed out, but dashboard was created")
         except FileNotFoundError:
-            print("⚠️  npm not found - install Node.js to use test dashboard")
+            self._log_print("⚠️  npm not found - install Node.js to use test dashboard")
         except Exception as e:
-            print(f"⚠️  Error installing dependencies: {e}")
-            print("   You can run 'npm install' manually in the test-dashboard-module directory")
+            self._log_print(f"⚠️  Error installing dependencies: {e}")
+            self._log_print("   You can run 'npm install' manually in the test-dashboard-module directory")
 
     def _update_gitignore(self):
         """Add appropriate .gitignore entries."""
         gitignore_path = self.target / ".gitignore"
         
-        entries_to_add = [
-            "\n# Claude task management",
-            "*.backup",
-            "CLAUDE.md.backup",
-            "\n# Test Dashboard Module",
-            "test-dashboard-module/node_modules/",
-            "test-dashboard-module/package-lock.json",
-            "test-dashboard-module/test-registry.json",
-        ]
-        
-        if gitignore_path.exists():
-            content = gitignore_path.read_text()
-            
-            # Check if already has claude entries
-            if "claude_tasks" in content:
-                print("✓ .gitignore already configured")
-                return
-            
-            # Append entries
-            if not content.endswith("\n"):
-                content += "\n"
-            
-            content += "\n".join(entries_to_add) + "\n"
-            gitignore_path.write_text(content)
-            print("📝 Updated .gitignore")
-        else:
-            # Create new .gitignore
-            content = "\n".join(entries_to_add) + "\n"
-            gitignore_path.write_text(content)
-            print("📝 Created .gitignore")
+        # One open covers both cases: a+b creates a missing .gitignore and
+        # appends to an existing one without rewriting it
+        with gitignore_path.open("a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Check if already has claude entries; they are appended
+                    # at the end, so search backwards
+                    if mapped.rfind(GITIGNORE_MARKER) != -1:
+                        self._log_print("✓ .gitignore already configured")
+                        return
+            f.write(GITIGNORE_ADDITIONS)
+        
+        self._log_print("📝 Updated .gitignore" if size else "📝 Created .gitignore")
     
     def _print_next_steps(self):
         """Print next steps for the user."""
-        claude_tasks_exists = self.claude_tasks_dir.exists()
-        test_dashboard_exists = (self.target / "test-dashboard-module").exists()
-        claude_md_exists = self.claude_md_path.exists()
+        claude_tasks_exists = "claude_tasks" in self._existing
+        test_dashboard_exists = "test-dashboard-module" in self._existing
+        claude_md_exists = "CLAUDE.md" in self._existing
         
-        print("\n📚 Next Steps:")
+        self._log_print("\n📚 Next Steps:")
         
         step_num = 1
         
         if claude_tasks_exists:
-            print(f"{step_num}. Review claude_tasks/QUICK_REFERENCE.md for workflow")
+            self._log_print(f"{step_num}. Review claude_tasks/QUICK_REFERENCE.md for workflow")
             step_num += 1
-            print(f"{step_num}. Read claude_tasks/PRINCIPLES_QUICK_CARD.md for principles")
+            self._log_print(f"{step_num}. Read claude_tasks/PRINCIPLES_QUICK_CARD.md for principles")
             step_num += 1
-            print(f"{step_num}. Add your first task to claude_tasks/active/ACTIVE_TASKS.md")
+            self._log_print(f"{step_num}. Add your first task to claude_tasks/active/ACTIVE_TASKS.md")
             step_num += 1
         
         if claude_md_exists:
-            print(f"{step_num}. Customize CLAUDE.md with project-specific information")
+            self._log_print(f"{step_num}. Customize CLAUDE.md with project-specific information")
             step_num += 1
         
         # Only suggest git commit if something was actually installed
         if claude_tasks_exists or test_dashboard_exists or claude_md_exists:
-            print(f"{step_num}. Commit the changes: git add . && git commit -m 'Add Claude components'")
+            self._log_print(f"{step_num}. Commit the changes: git add . && git commit -m 'Add Claude components'")
             step_num += 1
         
         # Test dashboard instructions
         if test_dashboard_exists:
-            print(f"\n📊 Test Dashboard:")
-            print(f"{step_num}. Start test dashboard: cd test-dashboard-module && npm start")
+            self._log_print(f"\n📊 Test Dashboard:")
+            self._log_print(f"{step_num}. Start test dashboard: cd test-dashboard-module && npm start")
             step_num += 1
-            print(f"{step_num}. Open http://localhost:8085 to manage tests")
+            self._log_print(f"{step_num}. Open http://localhost:8085 to manage tests")
             step_num += 1
-            print(f"{step_num}. Add project directories in the dashboard to scan multiple projects")
+            self._log_print(f"{step_num}. Add project directories in the dashboard to scan multiple projects")
         
         if claude_tasks_exists:
-            print("\n🎯 Start coding with: cat claude_tasks/SESSION_STARTER.md")
+            self._log_print("\n🎯 Start coding with: cat claude_tasks/SESSION_STARTER.md")
         elif test_dashboard_exists:
-            print("\n🎯 Manage tests with: cd test-dashboard-module && npm start")
+            self._log_print("\n🎯 Manage tests with: cd test-dashboard-module && npm start")
 
 
 def main():